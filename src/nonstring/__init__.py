@@ -1,4 +1,5 @@
 import collections.abc
+import functools
 import itertools
 import typing
 
@@ -7,9 +8,49 @@ class SeparableTypeError(Exception):
     """The object is not separable."""
 
 
+_SEPARABLE_FAST = {set, frozenset, dict, range}
+"""Exact types (besides `list` and `tuple`) that are known to be separable."""
+
+
 T = typing.TypeVar('T')
 
 
+_ITERABLE_FAST = {list, tuple, set, frozenset, dict, str, bytes, range}
+"""Exact types that are known to be iterable without probing."""
+
+
+@functools.singledispatch
+def _unique_one(items):
+    """Remove repeated items from a single iterable object."""
+    if type(items) not in _ITERABLE_FAST:
+        try:
+            iter(items)
+        except TypeError as err:
+            raise SeparableTypeError(
+                f"Cannot separate object of type"
+                f" {items.__class__.__qualname__!r}"
+            ) from err
+    return _unique_one(list(items))
+
+
+@_unique_one.register(list)
+@_unique_one.register(tuple)
+def _(items):
+    try:
+        return list(dict.fromkeys(items))
+    except TypeError:
+        collection = []
+        for item in items:
+            if item not in collection:
+                collection.append(item)
+        return collection
+
+
+@_unique_one.register(str)
+def _(items):
+    return list(dict.fromkeys(items))
+
+
 @typing.overload
 def unique(
     arg: typing.List[T],
@@ -27,7 +68,7 @@ def unique(
 @typing.overload
 def unique(*args: T, separable: bool=False) -> typing.List[T]: ...
 
-def unique(*args, separable=False):
+def unique(*args, separable=False, _type=type, _list=list, _len=len):
     """Remove repeated items from `args` while preserving order.
     
     Parameters
@@ -40,22 +81,58 @@ def unique(*args, separable=False):
         and `args` comprises a single iterable object, this function will
         extract that object under the assumption that the caller wants to remove
         repeated items from the given iterable object.
+
+    Notes
+    -----
+    - The underscored keyword parameters are private aliases of builtins,
+      pre-bound as local names for speed. Callers should not pass them.
     """
     items = (
-        args[0] if (separable and len(args) == 1)
+        args[0] if (separable and _len(args) == 1)
         else args
     )
-    try:
-        iter(items)
-    except TypeError as err:
-        raise SeparableTypeError(
-            f"Cannot separate object of type {items.__class__.__qualname__!r}"
-        ) from err
-    collection = []
-    for item in items:
-        if item not in collection:
-            collection.append(item)
-    return collection
+    t = _type(items)
+    if t is list or t is tuple:
+        if _len(items) <= 1:
+            return _list(items)
+        if _len(items) == 2:
+            return [items[0]] if items[0] == items[1] else _list(items)
+    return _unique_one(items)
+
+
+def unique_many(
+    iterables: typing.Iterable[typing.Iterable[T]],
+) -> typing.List[typing.List[T]]:
+    """Remove repeated items from each of many iterables.
+
+    This function applies the same order-preserving logic as `~unique` to
+    each member of `iterables`. It reuses a single internal set across
+    members, which amortizes allocation overhead when deduplicating many
+    small iterables back-to-back.
+
+    Parameters
+    ----------
+    iterables
+        The iterable objects from which to remove repeated items.
+
+    Returns
+    -------
+    `list` of `list`
+        The unique items of each member of `iterables`, in their original
+        order, in the order in which the members appear.
+    """
+    seen = set()
+    seen_add = seen.add
+    results = []
+    for it in iterables:
+        seen.clear()
+        if type(it) not in _ITERABLE_FAST:
+            it = list(it)
+        try:
+            results.append([x for x in it if not (x in seen or seen_add(x))])
+        except TypeError:
+            results.append(unique(it, separable=True))
+    return results
 
 
 _Wrapped = typing.TypeVar('_Wrapped', bound=typing.Iterable)
@@ -72,7 +149,7 @@ def unwrap(
 ) -> _Wrapped: ...
 
 
-def unwrap(obj, newtype=None):
+def unwrap(obj, newtype=None, *, _type=type, _len=len):
     """Remove redundant outer lists and tuples.
 
     This function will strip away enclosing instances of `list` or `tuple`, as
@@ -90,6 +167,11 @@ def unwrap(obj, newtype=None):
         the caller to ensure that the result is an iterable object after
         unwrapping interior iterables.
 
+    Notes
+    -----
+    - The underscored keyword parameters are private aliases of builtins,
+      pre-bound as local names for speed. Callers should not pass them.
+
     Returns
     -------
     Any
@@ -97,16 +179,32 @@ def unwrap(obj, newtype=None):
         (possibly empty) `list` or `tuple`.
     """
     seed = [obj]
-    wrapped = (list, tuple)
-    while isinstance(seed, wrapped) and len(seed) == 1:
+    t = _type(seed)
+    while (t is list or t is tuple) and _len(seed) == 1:
         seed = seed[0]
+        t = _type(seed)
     if newtype is not None:
+        if newtype is iter:
+            if seed is None:
+                return iter(())
+            if isinstance(seed, (bytes, bytearray)):
+                return iter(wrap(seed))
+            return iter(seed) if isseparable(seed) else iter((seed,))
+        if t is newtype or t is list or t is tuple:
+            return newtype(seed)
         return newtype(wrap(seed))
     return seed
 
 
+_WRAP_LIST_TYPES = {list, tuple, set, frozenset, range, dict}
+"""Exact types that `~wrap` converts directly to a `list`."""
+
+
 def wrap(
     arg: typing.Optional[typing.Union[T, typing.Iterable[T]]],
+    *,
+    _type=type,
+    _list=list,
 ) -> typing.List[T]:
     """Wrap `arg` in a list, if necessary.
 
@@ -116,17 +214,23 @@ def wrap(
     a one-element list containing `arg`. If `arg` is `None`, this function will
     return an empty list. If `arg` is a string, this function will return a
     one-element list containing `arg`.
+
+    The underscored keyword parameters are private aliases of builtins,
+    pre-bound as local names for speed. Callers should not pass them.
     """
     if arg is None:
         return []
+    t = _type(arg)
+    if t is str:
+        return [arg]
+    if t in _WRAP_LIST_TYPES:
+        return _list(arg)
     if isinstance(arg, str):
         return [arg]
     try:
-        iter(arg)
+        return _list(arg)
     except TypeError:
         return [arg]
-    else:
-        return list(arg)
 
 
 class Wrapper(collections.abc.Collection, typing.Generic[T]):
@@ -138,11 +242,23 @@ class Wrapper(collections.abc.Collection, typing.Generic[T]):
     equivalent `tuple`. When initialized with a non-"separable" object, the new
     instance will behave like a `tuple` containing that object.
 
+    Initialization only stores the given object; the equivalent `tuple` is
+    built on first use (e.g., iteration, length, or membership), so
+    constructing an instance is cheap regardless of the size of the argument.
+
     See Also
     --------
     `~isseparable`
     """
 
+    __slots__ = (
+        '_arg',
+        '_wrapped_cache',
+        '_sorted_cache',
+        '_counter_cache',
+        '_hash_cache',
+    )
+
     def __init__(
         self,
         this: typing.Optional[typing.Union[T, typing.Iterable[T]]],
@@ -150,7 +266,37 @@ class Wrapper(collections.abc.Collection, typing.Generic[T]):
     ) -> None:
         """Initialize a wrapped object from `this`"""
         self._arg = this
-        self._wrapped = tuple(wrap(this))
+        self._wrapped_cache = None
+        self._sorted_cache = None
+        self._counter_cache = None
+        self._hash_cache = None
+
+    @property
+    def _wrapped(self) -> typing.Tuple[T, ...]:
+        """The wrapped form of the original argument, computed on demand."""
+        wrapped = self._wrapped_cache
+        if wrapped is None:
+            wrapped = tuple(wrap(self._arg))
+            self._wrapped_cache = wrapped
+        return wrapped
+
+    @property
+    def _sorted(self) -> typing.Tuple[T, ...]:
+        """The sorted form of the wrapped members, computed on demand."""
+        result = self._sorted_cache
+        if result is None:
+            result = tuple(sorted(self._wrapped))
+            self._sorted_cache = result
+        return result
+
+    @property
+    def _counter(self) -> typing.Counter[T]:
+        """A multiset of the wrapped members, computed on demand."""
+        result = self._counter_cache
+        if result is None:
+            result = collections.Counter(self._wrapped)
+            self._counter_cache = result
+        return result
 
     def __iter__(self) -> typing.Iterator[T]:
         """Called for iter(self)."""
@@ -167,9 +313,23 @@ class Wrapper(collections.abc.Collection, typing.Generic[T]):
     def __eq__(self, other) -> bool:
         """True if two wrapped objects have equal arguments."""
         if isinstance(other, Wrapper):
-            return sorted(self) == sorted(other)
+            try:
+                return self._counter == other._counter
+            except TypeError:
+                return self._sorted == other._sorted
         return NotImplemented
 
+    def __hash__(self) -> int:
+        """Called for hash(self)."""
+        result = self._hash_cache
+        if result is None:
+            try:
+                result = hash(self._sorted)
+            except TypeError:
+                result = hash(frozenset(self._counter.items()))
+            self._hash_cache = result
+        return result
+
     def __str__(self) -> str:
         """A simplified representation of this object."""
         return self._arg
@@ -186,11 +346,14 @@ def isseparable(x, /):
     The motivation for this distinction is to make it easier to treat single
     numbers and strings equivalently to iterables of numbers and strings.
     """
-    try:
-        iter(x)
-    except TypeError:
+    t = type(x)
+    if t is str or t is bytes:
         return False
-    return not isinstance(x, (str, bytes))
+    if t is list or t is tuple or t in _SEPARABLE_FAST:
+        return True
+    if hasattr(t, '__iter__') or hasattr(t, '__getitem__'):
+        return not isinstance(x, (str, bytes))
+    return False
 
 
 class MergeError(Exception):
@@ -35,10 +35,31 @@ def test_unique_separable():
     for arg, iftrue in cases.items():
         assert nonstring.unique(arg) == [arg]
         assert nonstring.unique(arg, separable=True) == iftrue
+    assert nonstring.unique(
+        iter([1, [2], 1, 3]),
+        separable=True,
+    ) == [1, [2], 3]
     with pytest.raises(nonstring.SeparableTypeError):
         nonstring.unique(1, separable=True)
 
 
+def test_unique_many():
+    """Test the batched form of `unique`."""
+    cases = [
+        (
+            ['aabac', ('a', 'b', 'a'), (1, 2, 2)],
+            [['a', 'b', 'c'], ['a', 'b'], [1, 2]],
+        ),
+        ([], []),
+        ([()], [[]]),
+        ([[['a'], ['b'], ['a']]], [[['a'], ['b']]]),
+        ([iter([1, 2, 1])], [[1, 2]]),
+        ([iter([[1], [2], [1]])], [[[1], [2]]]),
+    ]
+    for arg, expected in cases:
+        assert nonstring.unique_many(arg) == expected
+
+
 def test_unwrap():
     """Test the function that removes certain outer sequence types."""
     cases = [[3], (3,), [[3]], [(3,)], ([3],), ((3,),)]